@@ -7,12 +7,14 @@ PAGE_CONFIG = {
 }
 
 LOCK_DIR = "data/locks"
+STALE_LOCK_SECONDS = 1800  # 30 minutes - locks older than this are cleaned up
 IMAGE_EXTENSIONS = ['.jpg', '.jpeg', '.png', '.tif', '.jp2']
 DEFAULT_SIDEBAR_WIDTH = 500
 
 # Cache TTL settings (in seconds)
 CACHE_TTL_SHORT = 300  # 5 minutes - for frequently changing data
 CACHE_TTL_MEDIUM = 600  # 10 minutes - for moderately stable data
+CACHE_TTL_LISTING = 30  # 30 seconds - lock-dependent file listings
 CACHE_TTL_LONG = 3600  # 1 hour - for rarely changing data
 
 def apply_custom_css():
@@ -159,6 +161,24 @@ def apply_custom_css():
             .css-1d391kg {{
                 background-color: var(--background-color, rgba(255,255,255,0.02));
             }}
+
+            /* Scroll box around the zoomed sidebar image */
+            .zoom-wrap {{
+                overflow: auto;
+                max-height: 600px;
+                border: 1px solid var(--border-color, #ddd);
+                border-radius: 8px;
+                padding: 10px;
+                background: var(--background-color, white);
+                box-shadow: inset 0 1px 3px rgba(0,0,0,0.1);
+            }}
+            .zoom-wrap img {{
+                max-width: none;
+            }}
+            .zoom-wrap p {{
+                font-size: 0.875rem;
+                opacity: 0.6;
+            }}
         </style>
         
         <script>
@@ -8,20 +8,21 @@ try:
     PLOTLY_AVAILABLE = True
 except ImportError:
     PLOTLY_AVAILABLE = False
-    st.error("⚠️ Dashboard requires pandas and plotly. Install with: pip install pandas plotly")
 
 from datetime import datetime, timedelta
 from typing import Dict, List, Tuple, Optional
 from pathlib import Path
 
 from config import LOCK_DIR
+from utils import current_user
 try:
     from gcs_utils import get_gcs_file_lists, get_gcs_client, get_bucket
     from file_ops import list_available_jsons, compare_json_versions, is_file_corrected
     GCS_AVAILABLE = True
+    GCS_IMPORT_ERROR = None
 except Exception as e:
     GCS_AVAILABLE = False
-    st.error(f"⚠️ GCS connection not available: {e}")
+    GCS_IMPORT_ERROR = str(e)
 
 
 def get_dashboard_metrics() -> Dict:
@@ -99,8 +100,7 @@ def get_lock_details() -> List[Dict]:
                         session_id = lock_data.get('session_id', 'Unknown')
             except:
                 # If lock file doesn't contain JSON, try to infer user from system
-                import getpass
-                user = getpass.getuser()
+                user = current_user()
                 session_id = 'Unknown'
             
             filename = lock_file.replace('.lock', '')
@@ -476,6 +476,13 @@ def render_dashboard():
     st.title("📊 JSON Validator Dashboard")
     st.markdown("Real-time insights into the correction process")
     
+    # Import problems are reported here rather than at import time, since the
+    # module is imported by main.py for every page
+    if not PLOTLY_AVAILABLE:
+        st.error("⚠️ Dashboard requires pandas and plotly. Install with: pip install pandas plotly")
+    if not GCS_AVAILABLE:
+        st.error(f"⚠️ GCS connection not available: {GCS_IMPORT_ERROR}")
+    
     # Add refresh button
     col1, col2 = st.columns([1, 4])
     with col1:
@@ -1,16 +1,36 @@
 import os
 import json
+import time
 import streamlit as st
+from concurrent.futures import ThreadPoolExecutor
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+from datetime import timedelta
 from gcs_utils import get_bucket, get_gcs_file_lists
-from config import LOCK_DIR, IMAGE_EXTENSIONS, CACHE_TTL_SHORT, CACHE_TTL_MEDIUM
+from config import LOCK_DIR, IMAGE_EXTENSIONS, CACHE_TTL_SHORT, CACHE_TTL_MEDIUM, CACHE_TTL_LISTING
+from utils import clean_json_text
+
+
+def get_lock_path(filename: str) -> str:
+    """Path of the lock file guarding *filename*"""
+    return LOCK_DIR + os.sep + filename + ".lock"
+
+
+def locked_files() -> set[str]:
+    """Names of all files that currently have a lock, from one directory scan"""
+    try:
+        with os.scandir(LOCK_DIR) as entries:
+            return {entry.name[:-5] for entry in entries if entry.name.endswith(".lock")}
+    except FileNotFoundError:
+        return set()
 
 
 def list_available_jsons() -> list[str]:
     raw, corr = get_gcs_file_lists()
+    locked = locked_files()
     available = []
     for f in sorted(raw):
         # skip anything that is currently locked
-        if os.path.exists(os.path.join(LOCK_DIR, f + ".lock")):
+        if f in locked:
             continue
         # skip anything that has been corrected
         if f in corr:
@@ -30,7 +50,7 @@ def is_file_corrected(filename: str) -> bool:
 
 def get_file_status(filename: str) -> str:
     """Get the status of a file (uncorrected, corrected, or locked)"""
-    if os.path.exists(os.path.join(LOCK_DIR, filename + ".lock")):
+    if os.path.exists(get_lock_path(filename)):
         return "locked"
     elif is_file_corrected(filename):
         return "corrected"
@@ -38,19 +58,47 @@ def get_file_status(filename: str) -> str:
         return "uncorrected"
 
 
-@st.cache_data(ttl=CACHE_TTL_SHORT)  # 5 min - frequently accessed/updated
+def files_cache_token() -> int:
+    """This session's listing cache token; bumping it forces fresh listings"""
+    return st.session_state.get("_files_cache_token", 0)
+
+
+def invalidate_file_listing() -> None:
+    """Make this session's next listing and status lookups skip the cache"""
+    # Cached entries are shared between sessions, so the token must be unique
+    st.session_state["_files_cache_token"] = time.time_ns()
+
+
+@st.cache_data(ttl=CACHE_TTL_LISTING, show_spinner=False)
+def cached_available_jsons(token: int = 0) -> list[str]:
+    """list_available_jsons() memoised across reruns, keyed by the cache token"""
+    return list_available_jsons()
+
+
+@st.cache_data(ttl=CACHE_TTL_LISTING, show_spinner=False)
+def cached_file_status(filename: str, token: int = 0) -> str:
+    """get_file_status() memoised across reruns, keyed by the cache token"""
+    return get_file_status(filename)
+
+
+@st.cache_data(ttl=CACHE_TTL_SHORT, show_spinner=False)  # 5 min - frequently accessed/updated
 def load_json_from_gcs(filename: str):
+    """Load a raw record from jsons/; returns (data, error).
+
+    Saving writes to corrected/, so a save never invalidates this cache.
+    """
     try:
         bucket = get_bucket()
         raw = bucket.blob(f"jsons/{filename}").download_as_text()
-        from utils import clean_json_text
         data = json.loads(clean_json_text(raw))
         return data, None
     except Exception as e:
         return None, str(e)
 
 
-@st.cache_data(ttl=CACHE_TTL_MEDIUM)  # 10 min - images rarely change
+# cache_resource hands back the cached bytes as-is; cache_data would unpickle a
+# fresh copy of the whole image on every rerun. Bytes are immutable, so sharing is safe.
+@st.cache_resource(ttl=CACHE_TTL_MEDIUM, max_entries=16, show_spinner=False)  # 10 min - images rarely change
 def load_image_from_gcs(base: str):
     bucket = get_bucket()
     for ext in IMAGE_EXTENSIONS:
@@ -60,6 +108,86 @@ def load_image_from_gcs(base: str):
     return None, None
 
 
+# Formats every browser can display; others are sent as bytes through st.image
+_BROWSER_IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png')
+
+
+@st.cache_data(ttl=CACHE_TTL_MEDIUM, show_spinner=False)  # 10 min - images rarely change
+def get_image_url(base: str):
+    """Signed GCS URL for a record image; returns (url, name).
+
+    The browser fetches and caches the image itself, so reruns only send the
+    URL. url is None when the image exists but can't be served that way, and
+    name is None when there is no image at all.
+    """
+    bucket = get_bucket()
+    for ext in IMAGE_EXTENSIONS:
+        blob = bucket.blob(f"images/{base}{ext}")
+        if blob.exists():
+            if ext not in _BROWSER_IMAGE_EXTENSIONS:
+                return None, f"{base}{ext}"
+            try:
+                # Outlive the cached entry so a cached URL never expires in use
+                url = blob.generate_signed_url(
+                    version="v4", expiration=timedelta(seconds=2 * CACHE_TTL_MEDIUM), method="GET"
+                )
+            except Exception:
+                url = None
+            return url, f"{base}{ext}"
+    return None, None
+
+
+# Fetches the image of the record being opened; never queued behind prefetches
+_load_pool = ThreadPoolExecutor(max_workers=4)
+# Background workers that warm the load caches for neighbouring records
+_prefetch_pool = ThreadPoolExecutor(max_workers=4)
+
+
+def _run_with_ctx(ctx, fn, *args):
+    # The st.cache_* functions expect the submitting session's ScriptRunContext
+    if ctx is not None:
+        add_script_run_ctx(ctx=ctx)
+    return fn(*args)
+
+
+def _submit(pool: ThreadPoolExecutor, fn, *args):
+    """pool.submit(fn, *args), running under the caller's ScriptRunContext"""
+    return pool.submit(_run_with_ctx, get_script_run_ctx(), fn, *args)
+
+
+def _warm_image(img_base: str) -> None:
+    """Fill the cache the sidebar will read for this image"""
+    url, name = get_image_url(img_base)
+    if name and not url:
+        load_image_from_gcs(img_base)
+
+
+def _prefetch_record(filename: str) -> None:
+    data, _ = load_json_from_gcs(filename)
+    _warm_image((data or {}).get("image_filename") or os.path.splitext(filename)[0])
+
+
+def load_record(filename: str):
+    """load_json_from_gcs(), with the record's default image fetched alongside.
+
+    The JSON and image round-trips overlap instead of running back to back.
+    Records naming a different image_filename load that one in the sidebar.
+    """
+    image = _submit(_load_pool, _warm_image, os.path.splitext(filename)[0])
+    result = load_json_from_gcs(filename)
+    try:
+        image.result()
+    except Exception:
+        pass  # the sidebar reports a missing image itself
+    return result
+
+
+def prefetch_records(filenames) -> None:
+    """Load records and their images into the caches without waiting for them"""
+    for filename in filenames:
+        _submit(_prefetch_pool, _prefetch_record, filename)
+
+
 def save_corrected_json(filename: str, data: dict):
     try:
         bucket = get_bucket()
@@ -77,7 +205,6 @@ def load_corrected_json(filename: str):
         blob = bucket.blob(f"corrected/{filename}")
         if blob.exists():
             raw = blob.download_as_text()
-            from utils import clean_json_text
             return json.loads(clean_json_text(raw))
         return None
     except Exception as e:
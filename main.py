@@ -1,15 +1,20 @@
 import os
 import json
-import getpass
+import time
 import streamlit as st
 import portalocker
 from typing import Any
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
-from config import PAGE_CONFIG, LOCK_DIR, apply_custom_css
-from file_ops import load_json_from_gcs, save_corrected_json, list_available_jsons
-from utils import clean_none_values
+from config import PAGE_CONFIG, LOCK_DIR, STALE_LOCK_SECONDS, apply_custom_css
+from file_ops import (
+    get_lock_path, load_record, save_corrected_json, list_available_jsons,
+    invalidate_file_listing,
+)
+from utils import clean_none_values, current_user
 from gcs_utils import get_gcs_file_lists
+from dashboard import render_dashboard
 from ui_components import (
     render_navigation,
     render_image_sidebar,
@@ -20,6 +25,14 @@ st.set_page_config(**PAGE_CONFIG)
 
 SESSION_DATA_DIR = "data/sessions"
 
+def _clear_session_keys(*keys: str) -> None:
+    """Drop several keys from session state in one pass"""
+    state = st.session_state
+    for key in keys:
+        if key in state:
+            del state[key]
+
+
 def load_session_progress(username: str) -> set:
     """Load finalized files for a user session"""
     os.makedirs(SESSION_DATA_DIR, exist_ok=True)
@@ -79,12 +92,13 @@ def auto_skip_to_next(current: str):
 def create_lock_with_user_info(lock_path: str, filename: str, user: str = None) -> portalocker.Lock:
     """Create a lock file with user information"""
     if user is None:
-        user = st.session_state.get("username", getpass.getuser())
+        user = st.session_state.get("username") or current_user()
+    now = datetime.now()
     
     lock_data = {
         "user": user,
         "filename": filename,
-        "locked_at": datetime.now().isoformat(),
+        "locked_at": now.isoformat(),
         "session_id": st.session_state.get("session_id", "unknown"),
         "pid": os.getpid()  # Add process ID for stale lock detection
     }
@@ -92,11 +106,12 @@ def create_lock_with_user_info(lock_path: str, filename: str, user: str = None)
     # Create and acquire the lock first
     lock = portalocker.Lock(lock_path, "w", timeout=0)
     try:
-        lock.acquire()
+        fh = lock.acquire()
         
-        # Write user info to the lock file using the file handle
-        with open(lock_path, 'w') as f:
-            json.dump(lock_data, f, indent=2)
+        # Write user info through the locked handle. Reopening or renaming the
+        # path would leave the flock on a different inode than the lock file.
+        json.dump(lock_data, fh, indent=2)
+        fh.flush()
         
         return lock
     except Exception as e:
@@ -118,7 +133,7 @@ def release_lock():
     lock = st.session_state.get("lock")
     locked_file = st.session_state.get("locked_file")
     if lock and locked_file:
-        lock_path = os.path.join(LOCK_DIR, locked_file + ".lock")
+        lock_path = get_lock_path(locked_file)
         
         # Try to release the lock object first
         lock_released = False
@@ -136,56 +151,67 @@ def release_lock():
             st.error(f"Failed to remove lock file {lock_path}: {e}")
         
         # Always clear session state
-        st.session_state.pop("lock", None)
-        st.session_state.pop("locked_file", None)
+        _clear_session_keys("lock", "locked_file")
         
         # Only show messages for problems, not routine operations
         if not lock_released:
             st.warning("⚠️ Lock file removed but lock object may not have been properly released")
 
 
+def _safe_remove(path: str) -> bool:
+    """Remove a file, reporting success instead of raising"""
+    try:
+        os.remove(path)
+        return True
+    except OSError:
+        return False
+
+
 def cleanup_stale_locks():
     """Clean up stale locks from crashed or timed-out sessions"""
     if not os.path.exists(LOCK_DIR):
         return []
     
     stale_locks = []
-    current_time = datetime.now()
+    stale_paths = []
+    now = time.time()
     
-    for lock_file in os.listdir(LOCK_DIR):
-        if not lock_file.endswith(".lock"):
-            continue
+    with os.scandir(LOCK_DIR) as entries:
+        for entry in entries:
+            if not entry.name.endswith(".lock"):
+                continue
             
-        lock_path = os.path.join(LOCK_DIR, lock_file)
-        try:
-            # Try to read lock info
-            with open(lock_path, 'r') as f:
-                lock_data = json.load(f)
+            # Decide staleness from the file's mtime; only stale locks are opened
+            try:
+                mtime = entry.stat().st_mtime
+            except OSError:
+                continue
+            if now - mtime <= STALE_LOCK_SECONDS:
+                continue
             
-            # Check if lock is stale (older than 30 minutes)
-            locked_at = datetime.fromisoformat(lock_data.get('locked_at', ''))
-            if (current_time - locked_at).total_seconds() > 1800:  # 30 minutes
-                os.remove(lock_path)
-                stale_locks.append({
-                    'file': lock_file.replace('.lock', ''),
-                    'user': lock_data.get('user', 'unknown'),
-                    'locked_at': locked_at
-                })
-                
-        except Exception as e:
-            # If we can't read the lock file, it's probably corrupted - remove it
+            stale = {
+                'file': entry.name.replace('.lock', ''),
+                'user': 'unknown',
+                'locked_at': datetime.fromtimestamp(mtime)
+            }
             try:
-                os.remove(lock_path)
-                stale_locks.append({
-                    'file': lock_file.replace('.lock', ''),
-                    'user': 'unknown',
-                    'locked_at': 'corrupted',
-                    'error': str(e)
-                })
-            except:
-                pass
+                # Read user info for the report; the lock is removed either way
+                with open(entry.path, 'r') as f:
+                    stale['user'] = json.load(f).get('user', 'unknown')
+            except Exception as e:
+                stale['error'] = str(e)
+            
+            stale_locks.append(stale)
+            stale_paths.append(entry.path)
+    
+    # Overlap the unlink calls when there are enough of them to pay for the pool
+    if len(stale_paths) > 4:
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            removed = list(executor.map(_safe_remove, stale_paths))
+    else:
+        removed = [_safe_remove(path) for path in stale_paths]
     
-    return stale_locks
+    return [stale for stale, ok in zip(stale_locks, removed) if ok]
 
 
 # Register shutdown cleanup if supported (Streamlit >= 1.28)
@@ -207,7 +233,7 @@ def main() -> None:
     
     # Initialize session ID for user tracking
     if "session_id" not in st.session_state:
-        st.session_state.session_id = datetime.now().strftime("%Y%m%d_%H%M%S") + "_" + getpass.getuser()
+        st.session_state.session_id = datetime.now().strftime("%Y%m%d_%H%M%S") + "_" + current_user()
 
     # ─── Page Navigation ─────────────────────────────────────────────────
     # Initialize page state
@@ -218,7 +244,7 @@ def main() -> None:
     with st.sidebar:
         # Username handling with proper state management
         if "username" not in st.session_state:
-            st.session_state.username = getpass.getuser()
+            st.session_state.username = current_user()
         
         # Username input/display with change functionality
         if st.session_state.get("changing_username", False):
@@ -262,17 +288,12 @@ def main() -> None:
     
     # Route to appropriate page
     if st.session_state.page == "dashboard":
-        from dashboard import render_dashboard
         render_dashboard()
         return
     
     # Continue with editor logic (existing functionality)
-    
-    # ─── Defensive lock cleanup ─────────────────────────────────────────
-    locked_file = st.session_state.get("locked_file")
-    if locked_file and not os.path.exists(os.path.join(LOCK_DIR, locked_file + ".lock")):
-        st.session_state.pop("locked_file", None)
-        st.session_state.pop("lock", None)
+    # The lock object lives in session state across reruns; whether its file
+    # still exists is checked once, below, when the current record is known.
 
     # ─── Initialise session state ──────────────────────────────────────
     st.session_state.setdefault("idx", 0)
@@ -280,19 +301,24 @@ def main() -> None:
 
     # Load session progress from disk (persistent across browser sessions)
     if "finalized_files" not in st.session_state:
-        username = st.session_state.get("username", getpass.getuser())
+        username = st.session_state.get("username") or current_user()
         st.session_state.finalized_files = load_session_progress(username)
 
     # ─── Navigation (release old lock first if changed) ────────────────
     prev_locked: str | None = st.session_state.get("locked_file")
     prev_lock_obj: Any | None = st.session_state.get("lock")
 
-    current = render_navigation()
-    st.session_state.current_file = current
+    # render_navigation keeps st.session_state.current_file in sync
+    try:
+        current = render_navigation()
+    finally:
+        # Consumed on every run, even one that stops before the form renders;
+        # a leftover flag would keep render_navigation from realigning idx
+        just_navigated = st.session_state.pop("just_navigated", False)
 
     if prev_locked and prev_locked != current:
         # Release old lock more carefully
-        old_lock_path = os.path.join(LOCK_DIR, prev_locked + ".lock")
+        old_lock_path = get_lock_path(prev_locked)
         
         # Try to release lock object
         if prev_lock_obj:
@@ -309,11 +335,12 @@ def main() -> None:
             st.error(f"Failed to remove lock file for {prev_locked}: {e}")
         
         # Clear session state
-        st.session_state.pop("lock", None)
-        st.session_state.pop("locked_file", None)
+        _clear_session_keys("lock", "locked_file")
+        # The old record is unlocked now; don't serve it from a stale listing
+        invalidate_file_listing()
 
     # ─── Acquire lock for current file ─────────────────────────────────
-    lock_path = os.path.join(LOCK_DIR, current + ".lock")
+    lock_path = get_lock_path(current)
     if "lock" not in st.session_state or st.session_state.get("locked_file") != current:
         try:
             lock = create_lock_with_user_info(lock_path, current)
@@ -354,6 +381,10 @@ def main() -> None:
         # Verify we still have the lock
         if not os.path.exists(lock_path):
             st.warning("🔓 Lock file was removed externally - reacquiring lock")
+            try:
+                lock.release()
+            except Exception:
+                pass
             try:
                 lock = create_lock_with_user_info(lock_path, current)
                 st.session_state["lock"] = lock
@@ -363,7 +394,7 @@ def main() -> None:
                 st.stop()
 
     # ─── Load JSON and show UI ─────────────────────────────────────────
-    data, error = load_json_from_gcs(current)
+    data, error = load_record(current)
     if error:
         st.error(f"Error loading JSON: {error}")
         st.stop()
@@ -381,7 +412,7 @@ def main() -> None:
         release_lock()
         auto_skip_to_next(current)
 
-    updated = render_edit_form(validated)
+    updated = render_edit_form(validated, just_navigated)
 
     # ─── Save & Finalise ───────────────────────────────────────────────
     if updated:
@@ -396,10 +427,11 @@ def main() -> None:
             
             # Clear cache to ensure file lists are updated
             get_gcs_file_lists.clear()
+            invalidate_file_listing()
 
             # Add to finalized files and save progress to disk
             st.session_state.finalized_files.add(current)
-            username = st.session_state.get("username", getpass.getuser())
+            username = st.session_state.get("username") or current_user()
             save_session_progress(username, st.session_state.finalized_files)
             release_lock()
 
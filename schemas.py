@@ -1,4 +1,7 @@
+import re
+import sys
 from enum import Enum
+from types import MappingProxyType
 
 
 class FieldType(Enum):
@@ -8,15 +11,49 @@ class FieldType(Enum):
     ENUM = "enum"
 
 
+# Person names: Latin letters incl. accented/extended blocks, spaces and punctuation.
+# Latin-1 letters (U+00C0-U+00FF) and Latin Extended-A/B are one contiguous range.
+# A bare class run: validators use fullmatch, so no anchors or group are needed.
+# Patterns only describe non-empty values: validate_field accepts an empty,
+# non-required field before any pattern is tried, so no "(|...)" alternatives.
+NAME_PATTERN = r"[a-zA-Z\u00C0-\u024F\u0300-\u036F\u1E00-\u1EFF\u2C60-\u2C7F\uA720-\uA7FF\s\-',\.\(\)]+"
+# ASCII-only subset of NAME_PATTERN; equivalent for pure-ASCII values
+NAME_ASCII_PATTERN = r"[a-zA-Z\s\-',\.\(\)]+"
+
+# Immutable and interned so it can be shared freely and compared by identity
+STREET_NAMES = tuple(sys.intern(street) for street in (
+    "Elisabeth Wolffstraat", "Saenredamstraat", "Spanderswoudstraat",
+    "Haarlemmerdijk", "Vossiusstraat", "Stierstraat", "Burgemeester Fockstraat"
+))
+
+# Shared patterns; fields that use the same one also share its compiled regex
+DATE_PATTERN = r"^\d{6}$"  # DDMMYY
+SEQ_PATTERN = r"^\d{1,3}$"  # record/volg numbers 1-999
+
+# Fields that are identical in main_entries and follow_up_entries
+_YEAR_OF_BIRTH = {
+    "type": FieldType.STRING.value,
+    "pattern": r"^\d{2}$",
+    "description": "Jaar (Geboortejaar) (YY) - Optional"
+}
+_WAARHEEN = {
+    "type": FieldType.STRING.value,
+    "description": "Waarheen",
+    "max_length": 200
+}
+_REMARKS = {
+    "type": FieldType.STRING.value,
+    "description": "Opmerkingen",
+    "max_length": 200
+}
+
+
 FIELD_SCHEMAS = {
     "header": {
         "street": {
             "type": FieldType.STRING.value,
             "description": "Straat",
-            "autocomplete": [
-                "Elisabeth Wolffstraat", "Saenredamstraat", "Spanderswoudstraat", 
-                "Haarlemmerdijk", "Vossiusstraat", "Stierstraat", "Burgemeester Fockstraat"
-            ],
+            "autocomplete": STREET_NAMES,
             "min_length": 5,
             "max_length": 100
         },
@@ -33,90 +70,116 @@ FIELD_SCHEMAS = {
         },
         "buurtletter": {
             "type": FieldType.STRING.value,
-            "pattern": r"^(|[A-Z]{2}\s*[A-Z]*\s*\d*)$",
+            "pattern": r"^[A-Z]{2}\s*[A-Z]*\s*\d*$",
             "description": "Buurtletter (Twee karakters + cijfers)"
         },
         "stemdistrict_nr": {
             "type": FieldType.STRING.value,
-            "pattern": r"^(|\d{2}\s*-\s*\d{3})$",
+            "pattern": r"^\d{2}\s*-\s*\d{3}$",
             "description": "Stemdistrict Nr."
         }
     },
     "main_entries": {
         "record_no": {
             "type": FieldType.STRING.value,
-            "pattern": r"^(|\d{1,3})$",
+            "pattern": SEQ_PATTERN,
             "description": "Record nummer (Optional, 1-999)"
         },
         "datum_registration": {
             "type": FieldType.STRING.value,
-            "pattern": r"^(\d{6})?$",
+            "pattern": DATE_PATTERN,
             "description": "Registratie Datum (DDMMYY)"
         },
         "gezinshoofd": {
             "type": FieldType.STRING.value,
-            "pattern": r"^([a-zA-ZÀ-ÿ\u0100-\u017F\u0180-\u024F\u0300-\u036F\u1E00-\u1EFF\u2C60-\u2C7F\uA720-\uA7FF\s\-',\.\(\)]+)?$",
+            "pattern": NAME_PATTERN,
+            "ascii_pattern": NAME_ASCII_PATTERN,
             "description": "Gezinshoofd (e.g., 'Scholten, Johannes' or 'sportzaal')",
             "max_length": 100
         },
-        "year_of_birth": {
-            "type": FieldType.STRING.value,
-            "pattern": r"^(|\d{2})$",
-            "description": "Jaar (Geboortejaar) (YY) - Optional"
-        },
+        "year_of_birth": _YEAR_OF_BIRTH,
         "datum_vertrek": {
             "type": FieldType.STRING.value,
-            "pattern": r"^(\d{6})?$",
+            "pattern": DATE_PATTERN,
             "description": "Verhuisdatum (Datum) (DDMMYY)",
         },
-        "waarheen": {
-            "type": FieldType.STRING.value,
-            "description": "Waarheen",
-            "min_length": 0,
-            "max_length": 200
-        },
-        "remarks": {
-            "type": FieldType.STRING.value,
-            "description": "Opmerkingen",
-            "max_length": 200
-        }
+        "waarheen": _WAARHEEN,
+        "remarks": _REMARKS
     },
     "follow_up_entries": {
         "volg_nr": {
             "type": FieldType.STRING.value,
-            "pattern": r"^(|\d{1,3})$",
+            "pattern": SEQ_PATTERN,
             "description": "Volgnr. (Optional, 1-999)",
         },
         "datum": {
             "type": FieldType.STRING.value,
-            "pattern": r"^(\d{6})?$",
+            "pattern": DATE_PATTERN,
             "description": "Datum (Inschrijfdatum) (DDMMYY)",
         },
         "inwonenden": {
             "type": FieldType.STRING.value,
-            "pattern": r"^([a-zA-ZÀ-ÿ\u0100-\u017F\u0180-\u024F\u0300-\u036F\u1E00-\u1EFF\u2C60-\u2C7F\uA720-\uA7FF\s\-',\.\(\)]+)?$",
+            "pattern": NAME_PATTERN,
+            "ascii_pattern": NAME_ASCII_PATTERN,
             "description": "Inwonenden (e.g., 'Scholten, Johannes' or other)",
             "max_length": 100
         },
-        "year_of_birth": {
-            "type": FieldType.STRING.value,
-            "pattern": r"^(|\d{2})$",
-            "description": "Jaar (Geboortejaar) (YY) - Optional",
-        },
+        "year_of_birth": _YEAR_OF_BIRTH,
         "datum_vertrek": {
             "type": FieldType.STRING.value,
-            "pattern": r"^(\d{6})?$",
+            "pattern": DATE_PATTERN,
             "description": "Verhuisdatum (DDMMYY)",
         },
-        "waarheen": {
-            "type": FieldType.STRING.value,
-            "description": "Waarheen",
-            "max_length": 200
-        },
-        "remarks": {
-            "type": FieldType.STRING.value,
-            "description": "Opmerkingen",
-            "max_length": 200
-        }
+        "waarheen": _WAARHEEN,
+        "remarks": _REMARKS
     }
 }
+
+
+# Matches patterns that are nothing but a run of digits: ^\d{N}$ or ^\d{M,N}$
+_DIGIT_RUN = re.compile(r"\^\\d\{(\d+)(?:,(\d+))?\}\$")
+
+
+def _compile_patterns(schemas: dict) -> None:
+    """Attach compiled regexes, digit-run bounds ("digits") and option sets to fields"""
+    compiled = {}  # pattern -> regex, so identical patterns share one object
+    for fields in schemas.values():
+        for field in fields.values():
+            if "pattern" in field:
+                pattern = field["pattern"]
+                if pattern not in compiled:
+                    compiled[pattern] = re.compile(pattern)
+                field["compiled"] = compiled[pattern]
+                # Lets validate_field use len() and str.isdecimal() instead of the regex
+                digit_run = _DIGIT_RUN.fullmatch(pattern)
+                if digit_run:
+                    min_digits = int(digit_run.group(1))
+                    field["digits"] = (min_digits, int(digit_run.group(2) or min_digits))
+            if "ascii_pattern" in field:
+                field["ascii_compiled"] = re.compile(field["ascii_pattern"])
+            if "options" in field:
+                # Enum membership by hash; the list stays for error messages
+                field["options_set"] = frozenset(field["options"])
+
+
+# Compile once at import so validation never goes through re's pattern cache
+_compile_patterns(FIELD_SCHEMAS)
+
+# Read-only from here on: sections and fields are exposed as mapping proxies
+FIELD_SCHEMAS = MappingProxyType({
+    section: MappingProxyType({name: MappingProxyType(field) for name, field in fields.items()})
+    for section, fields in FIELD_SCHEMAS.items()
+})
+
+# Shared stand-in for fields without a schema (falsy, so validation is skipped)
+EMPTY_SCHEMA = MappingProxyType({})
+
+# Flat (section, field) -> schema views for single-probe lookups
+FIELD_INDEX = {
+    (section, name): field
+    for section, fields in FIELD_SCHEMAS.items()
+    for name, field in fields.items()
+}
+FIELD_PATTERNS = {
+    key: field["compiled"] for key, field in FIELD_INDEX.items() if "compiled" in field
+}
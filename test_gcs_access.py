@@ -1,9 +1,29 @@
+import asyncio
 import gcsfs
 import json
 
-with open("key.json") as f:
-    gcs_conf = json.load(f)
+PREFIXES = [
+    "card_annotation/jsons",
+    "card_annotation/corrected",
+    "card_annotation/images",
+]
 
-fs = gcsfs.GCSFileSystem(token=gcs_conf)
 
-print(fs.ls("card_annotation/jsons"))
+async def main():
+    with open("key.json") as f:
+        gcs_conf = json.load(f)
+
+    # The async filesystem is bound to this loop; open and close its session here
+    fs = gcsfs.GCSFileSystem(token=gcs_conf, asynchronous=True)
+    session = await fs.set_session()
+    try:
+        # List all prefixes concurrently instead of one blocking round-trip each
+        results = await asyncio.gather(*(fs._ls(prefix) for prefix in PREFIXES))
+    finally:
+        await session.close()
+
+    for prefix, listing in zip(PREFIXES, results):
+        print(prefix, len(listing), listing[:5])
+
+
+asyncio.run(main())
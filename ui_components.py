@@ -1,38 +1,50 @@
 import base64
+import bisect
+import functools
+import html
+import mimetypes
 import os
+import re
+from itertools import islice
 from typing import Any, Dict, List, Optional
 
 import portalocker  # lock reference still needed elsewhere
 import streamlit as st
 import streamlit.components.v1 as components
 
-from config import LOCK_DIR
+from config import CACHE_TTL_MEDIUM, LOCK_DIR
 from file_ops import (
-    get_file_status,
-    list_available_jsons,
+    cached_available_jsons,
+    cached_file_status,
+    files_cache_token,
+    get_image_url,
+    invalidate_file_listing,
     load_image_from_gcs,
     load_json_from_gcs,
+    prefetch_records,
 )
-from schemas import FIELD_SCHEMAS, FieldType
-from utils import type_convert, validate_field, validate_entry_dates
+from schemas import EMPTY_SCHEMA, FIELD_INDEX, FieldType
+from utils import type_convert, validate_field_cached, validate_entry_dates
 
 
+_NUM_RE = re.compile(r"\d+")
+
+
+def _remove_leading_zeros(match: re.Match) -> str:
+    num = match.group(0)
+    # Keep at least one digit (handle edge case of all zeros)
+    return num.lstrip("0") or "0"
+
+
+@functools.lru_cache(maxsize=4096)
 def format_filename_for_display(filename: str) -> str:
     """
     Format filename for display by removing leading zeros from numeric parts.
 
     Example: WKAPL00197000001.json -> WKAPL197000001.json
     """
-    import re
-
-    def remove_leading_zeros(match):
-        num = match.group(0)
-        # Keep at least one digit (handle edge case of all zeros)
-        return num.lstrip("0") or "0"
-
     # Process each numeric sequence independently
-    formatted = re.sub(r"\d+", remove_leading_zeros, filename)
-    return formatted
+    return _NUM_RE.sub(_remove_leading_zeros, filename)
 
 
 __all__ = [
@@ -53,28 +65,42 @@ def create_field_input(
     value: Any,
     col,
     schema: Optional[Dict] = None,
+    current_file: Optional[str] = None,
 ) -> Any:
     """Render a single text input with inline validation and return the
     type‑converted value."""
     # Include current file name in the key to prevent cross-record value persistence
-    current_file = st.session_state.get("current_file", "unknown")
-    field_key = f"{current_file}.{section}.{key}"
+    if current_file is None:
+        current_file = st.session_state.get("current_file", "unknown")
+    field_key = _form_key(current_file, section, key)
+    _register_form_key(current_file, field_key)
     # field_key = key
 
     # Use description as label if available, otherwise use the key
     label = schema.get("description", key) if schema else key
 
     # Convert value to string and handle special cases
-    str_value = str(value)
+    orig_str = value if type(value) is str else str(value)
 
-    # For record_no and volg_nr fields, strip leading zeros for display
-    # (but keep them for other fields like dates)
-    if key in ("record_no", "volg_nr") and str_value.isdigit() and len(str_value) > 1:
-        str_value = str_value.lstrip('0') or '0'
+    # Seed the widget's state once; afterwards the keyed widget keeps its own
+    # value, so no value= is passed for Streamlit to reconcile on every run
+    if field_key not in st.session_state:
+        str_value = orig_str
+
+        # For record_no and volg_nr fields, strip leading zeros for display
+        # (but keep them for other fields like dates; ints never have any)
+        if (
+            type(value) is not int
+            and key in ("record_no", "volg_nr")
+            and str_value.isdigit()
+            and len(str_value) > 1
+        ):
+            str_value = str_value.lstrip('0') or '0'
+
+        st.session_state[field_key] = str_value
 
     inp = col.text_input(
         label,
-        value=str_value,
         key=field_key,
         placeholder=schema.get("placeholder", "") if schema else None,
     )
@@ -89,27 +115,52 @@ def create_field_input(
         if val_now.isdigit() and len(val_now) > 1:
             val_now = val_now.lstrip('0') or '0'
 
-    # Placeholder for an eventual error message
-    error_container = col.empty()
-
     if schema:
-        valid, err = validate_field(val_now, schema, key, section)
+        st.session_state.setdefault("_checked_error_keys", set()).add(field_key)
+        # Reuse the last result while neither the value nor the schema changed
+        valcache = st.session_state.setdefault("_valcache", {})
+        cached = valcache.get(field_key)
+        if cached and cached[0] == val_now and cached[1] == id(schema):
+            valid, err = cached[2], cached[3]
+        else:
+            valid, err = validate_field_cached(val_now, schema, key, section)
+            valcache[field_key] = (val_now, id(schema), valid, err)
         if not valid:
-            error_container.error(err)
+            # Only invalid fields get an element below the input
+            col.error(err)
             st.session_state.validation_errors[field_key] = err
         else:
-            # Remove any existing validation error and clear the container
+            # Remove any existing validation error
             st.session_state.validation_errors.pop(field_key, None)
-            error_container.empty()
 
+    # Untouched input converts straight back to the original; skip the parse
+    if val_now == orig_str and _round_trips(value, orig_str):
+        return value
     return type_convert(val_now, value)
 
 
+def _round_trips(value: Any, orig_str: str) -> bool:
+    """Whether type_convert(str(value), value) is known to give back *value*"""
+    value_type = type(value)
+    if value_type is str:
+        # type_convert strips whitespace, so only already-stripped strings qualify
+        return not (orig_str[:1].isspace() or orig_str[-1:].isspace())
+    # _parse_int reads str(int) back with int(), so every int is exact
+    return value_type is int or value_type is bool or value_type is float
+
+
 # ──────────────────────────────────────────────────────────────────────────────
 # Navigation + sidebar helpers
 # ──────────────────────────────────────────────────────────────────────────────
 
 
+# Review-flag keys the model adds next to a field; kept in the data, never shown
+_NEEDS_REVIEW_SUFFIX = "_needs review"
+
+_STATUS_EMOJI = {"uncorrected": "📝", "corrected": "✅", "locked": "🔒"}
+_STATUS_COLOR = {"uncorrected": "", "corrected": ":green", "locked": ":orange"}
+
+
 def _ensure_current_record_visible(files: List[str]) -> List[str]:
     """Guarantee that the file currently being edited is present in *files*.
 
@@ -117,20 +168,27 @@ def _ensure_current_record_visible(files: List[str]) -> List[str]:
     JSON is locked by *this* session (and therefore filtered‑out by
     `list_available_jsons`)."""
     current = st.session_state.get("current_file")
-    if current and current not in files:
+    if current and _sorted_index(files, current) is None:
         # Insert in correct alphabetical position to maintain ordering
-        files_copy = files[:]
-        files_copy.append(current)
-        files = sorted(files_copy)
+        files = files[:]
+        bisect.insort(files, current)
     return files
 
 
+def _sorted_index(files: List[str], name: str) -> Optional[int]:
+    """Position of *name* in the sorted *files* list, or None if absent"""
+    i = bisect.bisect_left(files, name)
+    return i if i < len(files) and files[i] == name else None
+
+
 def render_navigation() -> str:
     """Render Previous / Next buttons and return the *currently selected* file
     name. Ensures we never "lose" the record we're working on even while it's
     locked by the current user."""
 
-    files = _ensure_current_record_visible(list_available_jsons())
+    # Listings touch GCS and the lock dir; reuse them across keystroke reruns
+    token = files_cache_token()
+    files = _ensure_current_record_visible(cached_available_jsons(token))
 
     if not files:
         st.warning("No unprocessed records available.")
@@ -143,11 +201,11 @@ def render_navigation() -> str:
     # Only realign idx if we haven't just navigated (to prevent jumping back)
     current_locked = st.session_state.get("current_file")
     just_navigated = st.session_state.get("just_navigated", False)
-    if current_locked and current_locked in files and not just_navigated:
-        st.session_state.idx = files.index(current_locked)
-    elif just_navigated:
-        # Clear the navigation flag after handling it
-        st.session_state.pop("just_navigated", None)
+    locked_idx = _sorted_index(files, current_locked) if current_locked else None
+    if locked_idx is not None and not just_navigated:
+        if st.session_state.idx != locked_idx:
+            st.session_state.idx = locked_idx
+    # main() pops the flag after navigation and hands it to render_edit_form
 
     # ─── Enhanced navigation buttons ───────────────────────────────────────
     col_prev, col_info, col_next = st.columns([1, 2, 1])
@@ -166,6 +224,7 @@ def render_navigation() -> str:
         ):
             st.session_state.idx -= 1
             st.session_state.validation_errors.clear()
+            invalidate_file_listing()
 
     with col_info:
         # Enhanced progress indicator with statistics
@@ -197,21 +256,27 @@ def render_navigation() -> str:
         ):
             st.session_state.idx += 1
             st.session_state.validation_errors.clear()
+            invalidate_file_listing()
 
     current = files[st.session_state.idx]
-    st.session_state.current_file = current  # keep in sync for the next run
+    if st.session_state.get("current_file") != current:
+        st.session_state.current_file = current  # keep in sync for the next run
+
+    # Warm the caches for the neighbours so Previous/Next don't wait on GCS
+    if st.session_state.get("_prefetched_for") != current:
+        st.session_state["_prefetched_for"] = current
+        idx = st.session_state.idx
+        prefetch_records(files[i] for i in (idx + 1, idx - 1) if 0 <= i < len(files))
 
     # Show file status
-    status = get_file_status(current)
-    status_emoji = {"uncorrected": "📝", "corrected": "✅", "locked": "🔒"}
-    status_color = {"uncorrected": "", "corrected": ":green", "locked": ":orange"}
+    status = cached_file_status(current, token)
 
     # Format filename for display (remove leading zeros)
     display_name = format_filename_for_display(current)
     st.title(f"Record {st.session_state.idx + 1}/{len(files)}: {display_name}")
     st.markdown(
-        f"{status_emoji.get(status, '')} **Status**: "
-        f"{status_color.get(status, '')}{status.title()}"
+        f"{_STATUS_EMOJI.get(status, '')} **Status**: "
+        f"{_STATUS_COLOR.get(status, '')}{status.title()}"
     )
 
     if status == "corrected":
@@ -220,77 +285,95 @@ def render_navigation() -> str:
     return current
 
 
-def render_image_sidebar(data: Dict) -> None:
-    with st.sidebar:
-        st.header("📸 Image Reference")
-        img_base = (
-            data.get("image_filename")
-            or os.path.splitext(st.session_state.current_file)[0]
-        )
+@st.cache_resource(ttl=CACHE_TTL_MEDIUM, max_entries=16, show_spinner=False)
+def _image_data_uri(img_base: str) -> Optional[str]:
+    """Record image as a data URI, encoded once per image rather than per zoom change"""
+    img_bytes, img_name = load_image_from_gcs(img_base)
+    if not img_bytes:
+        return None
+    mime = mimetypes.guess_type(img_name)[0] or "image/jpeg"
+    return f"data:{mime};base64,{base64.b64encode(img_bytes).decode('ascii')}"
+
+
+def _image_sidebar(data: Dict) -> None:
+    st.header("📸 Image Reference")
+    img_base = (
+        data.get("image_filename")
+        or os.path.splitext(st.session_state.current_file)[0]
+    )
+    img_url, img_name = get_image_url(img_base)
+    img_bytes = None
+    if img_name and not img_url:
+        # Not signable or not a browser format: send the bytes instead
         img_bytes, img_name = load_image_from_gcs(img_base)
-        if img_bytes:
-            # Add zoom controls with more options
-            zoom_level = st.select_slider(
-                "🔍 Zoom Level",
-                options=["50%", "75%", "100%", "125%", "150%", "200%", "250%"],
-                value="100%",
-                key="image_zoom",
-                help="Adjust image size for better viewing",
+    if img_url or img_bytes:
+        # Add zoom controls with more options
+        zoom_level = st.select_slider(
+            "🔍 Zoom Level",
+            options=["50%", "75%", "100%", "125%", "150%", "200%", "250%"],
+            value="100%",
+            key="image_zoom",
+            help="Adjust image size for better viewing",
+        )
+
+        # Display image with zoom - use container width for consistent sizing
+        zoom_factor = int(zoom_level.rstrip("%")) / 100
+
+        # Create a container with specific styling for image zoom. The image
+        # goes inside the same markdown block so the scroll box wraps it.
+        if zoom_factor != 1.0:
+            width = int(480 * zoom_factor)  # Fixed base width for sidebar
+            caption = html.escape(f"📄 {img_name} ({zoom_level})")
+            # .zoom-wrap is styled once in apply_custom_css
+            st.markdown(
+                '<div class="zoom-wrap">'
+                f'<img src="{html.escape(img_url or _image_data_uri(img_base))}" width="{width}">'
+                f"<p>{caption}</p>"
+                "</div>",
+                unsafe_allow_html=True,
+            )
+        else:
+            st.image(
+                img_url or img_bytes, caption=f"📄 {img_name}", use_container_width=True
             )
 
-            # Display image with zoom - use container width for consistent sizing
-            zoom_factor = int(zoom_level.rstrip("%")) / 100
-
-            # Create a container with specific styling for image zoom
-            if zoom_factor != 1.0:
-                st.markdown(
-                    f"""
-                <div style="
-                    overflow: auto;
-                    max-height: 600px;
-                    border: 1px solid var(--border-color, #ddd);
-                    border-radius: 8px;
-                    padding: 10px;
-                    background: var(--background-color, white);
-                    box-shadow: inset 0 1px 3px rgba(0,0,0,0.1);
-                ">
-                """,
-                    unsafe_allow_html=True,
-                )
+        # Image info
+        st.caption(f"File: {img_name}")
 
-                st.image(
-                    img_bytes,
-                    caption=f"📄 {img_name} ({zoom_level})",
-                    use_container_width=False,
-                    width=int(480 * zoom_factor),  # Fixed base width for sidebar
-                )
+        # Quick image actions
+        col1, col2 = st.columns(2)
+        with col1:
+            if st.button(
+                "🔄 Refresh", help="Reload image", use_container_width=True
+            ):
+                # Only the image caches; listings and record JSON stay warm
+                get_image_url.clear()
+                load_image_from_gcs.clear()
+                _image_data_uri.clear()
+                st.rerun()
+        with col2:
+            # Download button would go here if needed
+            st.button(
+                "🔍 Enhance",
+                help="Coming soon",
+                disabled=True,
+                use_container_width=True,
+            )
+    else:
+        st.error(f"📷 Image not found for {img_base}")
+        st.info("Check if the image file exists in the GCS bucket")
 
-                st.markdown("</div>", unsafe_allow_html=True)
-            else:
-                st.image(img_bytes, caption=f"📄 {img_name}", use_container_width=True)
-
-            # Image info
-            st.caption(f"File: {img_name}")
-
-            # Quick image actions
-            col1, col2 = st.columns(2)
-            with col1:
-                if st.button(
-                    "🔄 Refresh", help="Reload image", use_container_width=True
-                ):
-                    st.cache_data.clear()
-                    st.rerun()
-            with col2:
-                # Download button would go here if needed
-                st.button(
-                    "🔍 Enhance",
-                    help="Coming soon",
-                    disabled=True,
-                    use_container_width=True,
-                )
-        else:
-            st.error(f"📷 Image not found for {img_base}")
-            st.info("Check if the image file exists in the GCS bucket")
+
+# Run the sidebar as a fragment where supported (Streamlit >= 1.37), so the zoom
+# slider reruns only the image and not the whole editor with its lock checks.
+if hasattr(st, "fragment"):
+    _image_sidebar = st.fragment(_image_sidebar)
+
+
+def render_image_sidebar(data: Dict) -> None:
+    # Fragments can't open st.sidebar themselves, so enter it out here
+    with st.sidebar:
+        _image_sidebar(data)
 
 
 # ──────────────────────────────────────────────────────────────────────────────
@@ -298,45 +381,327 @@ def render_image_sidebar(data: Dict) -> None:
 # ──────────────────────────────────────────────────────────────────────────────
 
 
+@functools.lru_cache(maxsize=64)
+def _section_header(section: str) -> str:
+    section_title = section.replace("_", " ").title()
+    return f"### 📋 {section_title}"
+
+
+@functools.lru_cache(maxsize=1024)
+def _entry_title(section: str, idx: int, person_name: str) -> str:
+    """Expander title for a list entry, showing the person's name if known"""
+    if person_name:
+        if section == "main_entries":
+            # Show full name in entry header
+            return f"👤 **Main Entry #{idx}: {person_name}**"
+        if section == "follow_up_entries":
+            return f"👥 **Follow-up #{idx}: {person_name}**"
+    return f"📝 {section.title().rstrip('s')} #{idx}"
+
+
+@functools.lru_cache(maxsize=4096)
+def _form_key(*parts: str) -> str:
+    """Session-state key for a form element; same parts, same string object"""
+    return ".".join(parts)
+
+
+def _register_form_key(filename: str, key: str) -> None:
+    """Remember a per-record session key so _clear_form_state can drop it directly"""
+    st.session_state.setdefault("_form_keys", {}).setdefault(filename, set()).add(key)
+
+
+# One-shot scroll to top and focus of the first input, run from the component
+# iframe against the app document. Streamlit scrolls its main container, not
+# the window, so both are reset.
+_SCROLL_TO_TOP_HTML = """
+<script>
+requestAnimationFrame(() => {
+    const doc = window.parent.document;
+    window.parent.scrollTo(0, 0);
+    doc.querySelectorAll('[data-testid="stAppViewContainer"], section.main, .main')
+        .forEach(el => { el.scrollTop = 0; });
+    const firstInput = doc.querySelector('input[type="text"], textarea, select');
+    if (firstInput) {
+        firstInput.focus({preventScroll: true});
+    }
+});
+</script>
+"""
+
+
 def _clear_form_state():
     """Clear form state when navigating to a new record to prevent value persistence"""
     current_file = st.session_state.get("current_file", "unknown")
     if current_file:
-        # Clear any session state keys that start with the current file name
-        keys_to_remove = []
-        for key in st.session_state.keys():
-            if isinstance(key, str) and key.startswith(f"{current_file}."):
-                keys_to_remove.append(key)
+        registry = st.session_state.setdefault("_form_keys", {})
 
-        for key in keys_to_remove:
+        # Clear the session state keys registered for the current file
+        valcache = st.session_state.get("_valcache", {})
+        for key in registry.pop(current_file, ()):
             st.session_state.pop(key, None)
+            valcache.pop(key, None)
 
         # Also clear deleted entries tracking for previous file
         prev_file = st.session_state.get("previous_file")
-        if prev_file:
-            for key in list(st.session_state.keys()):
-                if isinstance(key, str) and key.startswith(f"{prev_file}.deleted_"):
-                    st.session_state.pop(key, None)
+        if prev_file and prev_file in registry:
+            prev_keys = registry[prev_file]
+            deleted = {key for key in prev_keys if key.startswith(f"{prev_file}.deleted_")}
+            for key in deleted:
+                st.session_state.pop(key, None)
+            prev_keys -= deleted
+
+
+def _render_dict_section(section: str, content: Dict, current_file: str) -> Dict:
+    """Render a dict-like section (e.g. the header) as one input per field"""
+    result: Dict = {}
+    for key, orig in content.items():
+        if key.endswith(_NEEDS_REVIEW_SUFFIX):
+            continue
+        # Skip M/V fields - preserve them but don't show in form
+        if key in ("M", "V"):
+            result[key] = orig
+            continue
+        field_schema = FIELD_INDEX.get((section, key), EMPTY_SCHEMA)
+
+        val = create_field_input(
+            section,
+            key,
+            orig,
+            st,
+            field_schema,
+            current_file,
+        )
+        result[key] = val
+    return result
+
+
+def _render_list_section(section: str, content: List[Dict], current_file: str) -> List[Dict]:
+    """Render each entry of a list section in an expander with delete controls"""
+    result: List[Dict] = []
+
+    # Get deleted entries tracking (bit idx set = entry idx deleted)
+    deleted_key = f"{current_file}.deleted_{section}"
+    if deleted_key not in st.session_state:
+        st.session_state[deleted_key] = 0
+        _register_form_key(current_file, deleted_key)
+
+    # Track pending deletion confirmation
+    pending_confirm_key = f"{current_file}.pending_confirm_{section}"
+    if pending_confirm_key not in st.session_state:
+        st.session_state[pending_confirm_key] = None
+        _register_form_key(current_file, pending_confirm_key)
+
+    deleted_mask = st.session_state[deleted_key]
+    for idx, entry in enumerate(content, start=1):
+        # Skip if this entry is marked for deletion
+        if (deleted_mask >> idx) & 1:
+            continue
+
+        # Better entry headers with person names
+        if section == "main_entries":
+            person_name = entry.get("gezinshoofd", "").strip()
+        elif section == "follow_up_entries":
+            person_name = entry.get("inwonenden", "").strip()
+        else:
+            person_name = ""
+        entry_title = _entry_title(section, idx, person_name)
+
+        with st.expander(entry_title, expanded=True):
+            temp: Dict = {}
+            entry_section = f"{section}[{idx}]"
+
+            for key, orig in entry.items():
+                if key.endswith(_NEEDS_REVIEW_SUFFIX):
+                    continue
+                # Skip M/V fields - preserve them but don't show in form
+                if key in ("M", "V"):
+                    temp[key] = orig
+                    continue
+                field_schema = FIELD_INDEX.get((section, key), EMPTY_SCHEMA)
+
+                val = create_field_input(
+                    entry_section,
+                    key,
+                    orig,
+                    st,
+                    field_schema,
+                    current_file,
+                )
+                temp[key] = val
+
+            # Validate entry dates (departure must be after registration)
+            date_valid, date_error = validate_entry_dates(temp, section)
+            error_key = _form_key(current_file, entry_section, "date_comparison")
+            st.session_state.setdefault("_checked_error_keys", set()).add(error_key)
+            if not date_valid:
+                st.error(date_error)
+                st.session_state.validation_errors[error_key] = date_error
+            else:
+                # Clear any existing date comparison error for this entry
+                st.session_state.validation_errors.pop(error_key, None)
+
+            result.append(temp)
+
+            # Add delete button at the bottom of the expander
+            st.markdown("---")
+
+            # Check if this entry is pending confirmation
+            is_pending_confirm = st.session_state[pending_confirm_key] == idx
+
+            if is_pending_confirm:
+                # Show confirmation buttons
+                conf_col1, conf_col2, conf_col3 = st.columns([3, 1, 1])
+                with conf_col1:
+                    st.warning(f"⚠️ Delete this entry?")
+                with conf_col2:
+                    confirm_yes = st.form_submit_button(
+                        "✓ Yes",
+                        help="Confirm deletion",
+                        use_container_width=True,
+                    )
+                with conf_col3:
+                    confirm_no = st.form_submit_button(
+                        "✗ No",
+                        help="Cancel deletion",
+                        use_container_width=True,
+                    )
+
+                # Handle confirmation outside the columns
+                if confirm_yes:
+                    st.session_state[deleted_key] |= 1 << idx
+                    st.session_state[pending_confirm_key] = None
+                    st.rerun()
+                elif confirm_no:
+                    st.session_state[pending_confirm_key] = None
+                    st.rerun()
+            else:
+                # Show delete button
+                _, delete_col2 = st.columns([5, 1])
+                with delete_col2:
+                    # Use unique label including section name to avoid duplicate key errors
+                    delete_clicked = st.form_submit_button(
+                        f"🗑️ Del {section[:4]}{idx}",
+                        help=f"Delete this entry",
+                        use_container_width=True,
+                    )
+
+                if delete_clicked:
+                    # Set pending confirmation
+                    st.session_state[pending_confirm_key] = idx
+                    st.rerun()
 
+    return result
 
-def render_edit_form(validated_data: Dict) -> Optional[Dict]:
+
+def _render_scalar_section(section: str, content: Any, current_file: str) -> Any:
+    """Render a bare scalar section as a single text input"""
+    _register_form_key(current_file, f"{current_file}.{section}")
+    inp = st.text_input(
+        section, value=str(content), key=f"{current_file}.{section}"
+    )
+    return type_convert(inp, content)
+
+
+_SHORTCUTS_HELP = """
+**⌨️ Keyboard Shortcuts:**
+- `Enter`: Save/validate current field
+- `Tab`: Move to next field
+- `Ctrl + S`: Save all changes and move to next record
+- `Ctrl + →`: Next record
+- `Ctrl + ←`: Previous record
+"""
+
+_QUICK_TIPS = """
+**Quick Tips:**
+- Use `Tab` to move between fields
+- Date format: DDMMYY (e.g., 160636)
+- Names: Last, First (e.g., Keijzer, Tonko)
+- Leave empty if illegible
+"""
+
+_COMMON_PATTERNS = """
+**Common Patterns:**
+- House numbers: 18, 18a, 18 II, 18 huis
+- Dates: 6 digits DDMMYY
+- Years: 2 digits YY (94 = 1894)
+"""
+
+
+# Section renderer by the JSON type of the section's content
+_SECTION_RENDERERS = {
+    dict: _render_dict_section,
+    list: _render_list_section,
+}
+
+
+def _render_data_summary(updated: Dict) -> None:
+    """Key fields of the record next to the first few validation errors"""
+    summary_col1, summary_col2 = st.columns(2)
+
+    with summary_col1:
+        # Show key data points
+        st.markdown("**Key Information:**")
+        if isinstance(updated.get("header"), dict):
+            header = updated["header"]
+            for key, value in header.items():
+                if value and not key.endswith(_NEEDS_REVIEW_SUFFIX):
+                    st.text(f"• {key.replace('_', ' ').title()}: {value}")
+        if isinstance(updated.get("main_entries"), list):
+            for idx, entry in enumerate(updated["main_entries"], 1):
+                name = entry.get("gezinshoofd", "")
+                if name:
+                    st.text(f"• Person #{idx}: {name}")
+
+    with summary_col2:
+        # Show errors
+        errors = st.session_state.validation_errors
+        if errors:
+            st.markdown("**❌ Validation Errors:**")
+            for error in islice(errors.values(), 3):
+                st.text(f"• {error}")
+            if len(errors) > 3:
+                st.text(f"• ... and {len(errors) - 3} more")
+
+
+def _render_error_status(slot) -> None:
+    """Quick validation status with more detail, written into *slot*"""
+    errors = st.session_state.validation_errors
+    if errors:
+        error_count = len(errors)
+        # Get first few field names with errors
+        error_fields = islice(errors, 3)
+        # Extract just the field name from keys like "main_entries_0_datum"
+        field_names = [k.split('_')[-1] for k in error_fields]
+        fields_preview = ', '.join(field_names)
+        if error_count > 3:
+            fields_preview += f" +{error_count - 3} more"
+        slot.error(
+            f"❌ {error_count} error{'s' if error_count != 1 else ''}: "
+            f"{fields_preview}"
+        )
+    else:
+        slot.success("✅ Valid")
+
+
+def render_edit_form(validated_data: Dict, just_navigated: bool = False) -> Optional[Dict]:
     """Render the editable form and return a corrected payload only when the
     user presses **Save corrections** *and* no validation errors remain. On
     validation failure the function returns None and the user stays on the same
     record."""
 
-    # Clear any stale errors from previous record / rerun
-    st.session_state.validation_errors.clear()
+    # Errors are reconciled per field as the form renders instead of being
+    # cleared up front; keys checked this run are collected so entries for
+    # fields that are gone (other record, deleted entry) can be pruned after.
+    st.session_state["_checked_error_keys"] = set()
 
     # Clear form state when navigating to a new record
-    if st.session_state.get("just_navigated", False):
+    # The flag drives the form reset here and the scroll below
+    if just_navigated:
         _clear_form_state()
 
     # Enhanced header with stats and options
-    col1, col2, col3 = st.columns([2, 1, 1])
-
-    with col1:
-        st.write("")  # Placeholder for layout consistency
+    # The first column is left empty as spacing
+    _, col2, col3 = st.columns([2, 1, 1])
 
     with col2:
         # Toggleable keyboard shortcuts hint
@@ -350,63 +715,22 @@ def render_edit_form(validated_data: Dict) -> Optional[Dict]:
                 st.session_state.show_shortcuts_panel = True
 
     with col3:
-        # Quick validation status with more detail
-        if st.session_state.validation_errors:
-            error_count = len(st.session_state.validation_errors)
-            # Get first few field names with errors
-            error_fields = list(st.session_state.validation_errors.keys())[:3]
-            # Extract just the field name from keys like "main_entries_0_datum"
-            field_names = [k.split('_')[-1] for k in error_fields]
-            fields_preview = ', '.join(field_names)
-            if error_count > 3:
-                fields_preview += f" +{error_count - 3} more"
-            st.error(
-                f"❌ {error_count} error{'s' if error_count != 1 else ''}: "
-                f"{fields_preview}"
-            )
-        else:
-            st.success("✅ Valid")
+        # Filled in once the form has reconciled this run's errors
+        status_slot = st.empty()
 
     # Show shortcuts panel if toggled on
     if st.session_state.get("show_shortcuts_panel", False):
-        st.info(
-            """
-        **⌨️ Keyboard Shortcuts:**
-        - `Enter`: Save/validate current field
-        - `Tab`: Move to next field
-        - `Ctrl + S`: Save all changes and move to next record
-        - `Ctrl + →`: Next record
-        - `Ctrl + ←`: Previous record
-        """
-        )
+        st.info(_SHORTCUTS_HELP)
 
     # Better info styling with expandable tips
-    info_col, tips_col = st.columns([3, 1])
-
-    with info_col:
-        st.write("")  # Placeholder for layout consistency
+    _, tips_col = st.columns([3, 1])
 
     with tips_col:
         with st.expander("💡 Annotation Tips"):
-            st.markdown(
-                """
-            **Quick Tips:**
-            - Use `Tab` to move between fields
-            - Date format: DDMMYY (e.g., 160636)
-            - Names: Last, First (e.g., Keijzer, Tonko)
-            - Leave empty if illegible
-            """
-            )
+            st.markdown(_QUICK_TIPS)
 
             # Quick reference for common patterns
-            st.markdown(
-                """
-            **Common Patterns:**
-            - House numbers: 18, 18a, 18 II, 18 huis
-            - Dates: 6 digits DDMMYY
-            - Years: 2 digits YY (94 = 1894)
-            """
-            )
+            st.markdown(_COMMON_PATTERNS)
 
     # Initialize deletion tracking
     current_file = st.session_state.get("current_file", "unknown")
@@ -422,168 +746,29 @@ def render_edit_form(validated_data: Dict) -> Optional[Dict]:
                 continue
 
             # Better section headers with visual separators
-            section_title = section.replace("_", " ").title()
-            header_text = f"### 📋 {section_title}"
-
-            st.markdown(header_text)
+            st.markdown(_section_header(section))
             st.markdown("---")
 
-            section_schema = FIELD_SCHEMAS.get(section, {})
-
-            # Dict‑like subsection
-            if isinstance(content, dict):
-                updated[section] = {}
-
-                for key, orig in content.items():
-                    if key.endswith("_needs review"):
-                        continue
-                    # Skip M/V fields - preserve them but don't show in form
-                    if key in ("M", "V"):
-                        updated[section][key] = orig
-                        continue
-                    with st.container():
-                        field_schema = section_schema.get(key, {})
-
-                        val = create_field_input(
-                            section,
-                            key,
-                            orig,
-                            st,
-                            field_schema,
-                        )
-                        updated[section][key] = val
-
-            # List‑like subsection
-            elif isinstance(content, list):
-                updated[section] = []
-
-                # Get deleted entries tracking
-                deleted_key = f"{current_file}.deleted_{section}"
-                if deleted_key not in st.session_state:
-                    st.session_state[deleted_key] = set()
-
-                # Track pending deletion confirmation
-                pending_confirm_key = f"{current_file}.pending_confirm_{section}"
-                if pending_confirm_key not in st.session_state:
-                    st.session_state[pending_confirm_key] = None
+            render_section = _SECTION_RENDERERS.get(type(content), _render_scalar_section)
+            updated[section] = render_section(section, content, current_file)
 
-                for idx, entry in enumerate(content, start=1):
-                    # Skip if this entry is marked for deletion
-                    if idx in st.session_state[deleted_key]:
-                        continue
-
-                    # Better entry headers with person names
-                    entry_title = f"📝 {section.title().rstrip('s')} #{idx}"
-
-                    # Add person name to entry title if available
-                    if section == "main_entries":
-                        person_name = entry.get("gezinshoofd", "").strip()
-                        if person_name:
-                            # Show full name in entry header
-                            entry_title = f"👤 **Main Entry #{idx}: {person_name}**"
-                    elif section == "follow_up_entries":
-                        person_name = entry.get("inwonenden", "").strip()
-                        if person_name:
-                            entry_title = f"👥 **Follow-up #{idx}: {person_name}**"
-
-                    with st.expander(entry_title, expanded=True):
-                        temp: Dict = {}
-
-                        for key, orig in entry.items():
-                            if key.endswith("_needs review"):
-                                continue
-                            # Skip M/V fields - preserve them but don't show in form
-                            if key in ("M", "V"):
-                                temp[key] = orig
-                                continue
-                            with st.container():
-                                field_schema = section_schema.get(key, {})
-
-                                val = create_field_input(
-                                    f"{section}[{idx}]",
-                                    key,
-                                    orig,
-                                    st,
-                                    field_schema,
-                                )
-                                temp[key] = val
-
-                        # Validate entry dates (departure must be after registration)
-                        date_valid, date_error = validate_entry_dates(temp, section)
-                        if not date_valid:
-                            error_key = f"{current_file}.{section}[{idx}].date_comparison"
-                            st.error(date_error)
-                            st.session_state.validation_errors[error_key] = date_error
-                        else:
-                            # Clear any existing date comparison error for this entry
-                            error_key = f"{current_file}.{section}[{idx}].date_comparison"
-                            st.session_state.validation_errors.pop(error_key, None)
-
-                        updated[section].append(temp)
-
-                        # Add delete button at the bottom of the expander
-                        st.markdown("---")
-
-                        # Check if this entry is pending confirmation
-                        is_pending_confirm = st.session_state[pending_confirm_key] == idx
-
-                        if is_pending_confirm:
-                            # Show confirmation buttons
-                            conf_col1, conf_col2, conf_col3 = st.columns([3, 1, 1])
-                            with conf_col1:
-                                st.warning(f"⚠️ Delete this entry?")
-                            with conf_col2:
-                                confirm_yes = st.form_submit_button(
-                                    "✓ Yes",
-                                    help="Confirm deletion",
-                                    use_container_width=True,
-                                )
-                            with conf_col3:
-                                confirm_no = st.form_submit_button(
-                                    "✗ No",
-                                    help="Cancel deletion",
-                                    use_container_width=True,
-                                )
-
-                            # Handle confirmation outside the columns
-                            if confirm_yes:
-                                st.session_state[deleted_key].add(idx)
-                                st.session_state[pending_confirm_key] = None
-                                st.rerun()
-                            elif confirm_no:
-                                st.session_state[pending_confirm_key] = None
-                                st.rerun()
-                        else:
-                            # Show delete button
-                            _, delete_col2 = st.columns([5, 1])
-                            with delete_col2:
-                                # Use unique label including section name to avoid duplicate key errors
-                                delete_clicked = st.form_submit_button(
-                                    f"🗑️ Del {section[:4]}{idx}",
-                                    help=f"Delete this entry",
-                                    use_container_width=True,
-                                )
-
-                            if delete_clicked:
-                                # Set pending confirmation
-                                st.session_state[pending_confirm_key] = idx
-                                st.rerun()
-
-            # Scalar subsection
-            else:
-                inp = st.text_input(
-                    section, value=str(content), key=f"{current_file}.{section}"
-                )
-                updated[section] = type_convert(inp, content)
+        # Drop errors for fields that were not rendered this run
+        errors = st.session_state.validation_errors
+        checked = st.session_state["_checked_error_keys"]
+        for key in [key for key in errors if key not in checked]:
+            del errors[key]
+
+        _render_error_status(status_slot)
 
         # ─── Validation summary & save button ────────────────────────────
         col1, col2 = st.columns([3, 1])
 
         with col1:
-            if st.session_state.validation_errors:
+            error_count = len(st.session_state.validation_errors)
+            if error_count:
                 st.error(
-                    f"⚠️ {len(st.session_state.validation_errors)} validation error"
-                    f"{'s' if len(st.session_state.validation_errors) != 1 else ''} – "
+                    f"⚠️ {error_count} validation error"
+                    f"{'s' if error_count != 1 else ''} – "
                     "please fix before saving."
                 )
             else:
@@ -598,35 +783,12 @@ def render_edit_form(validated_data: Dict) -> Optional[Dict]:
                 type="primary",
             )
 
-        # Quick data summary for review
-        with st.expander(
-            "📊 Data Summary", expanded=len(st.session_state.validation_errors) > 0
-        ):
-            summary_col1, summary_col2 = st.columns(2)
-
-            with summary_col1:
-                # Show key data points
-                st.markdown("**Key Information:**")
-                if isinstance(updated.get("header"), dict):
-                    header = updated["header"]
-                    for key, value in header.items():
-                        if value and not key.endswith("_needs review"):
-                            st.text(f"• {key.replace('_', ' ').title()}: {value}")
-                if isinstance(updated.get("main_entries"), list):
-                    for idx, entry in enumerate(updated["main_entries"], 1):
-                        name = entry.get("gezinshoofd", "")
-                        if name:
-                            st.text(f"• Person #{idx}: {name}")
-
-            with summary_col2:
-                # Show errors
-                if st.session_state.validation_errors:
-                    st.markdown("**❌ Validation Errors:**")
-                    errors = list(st.session_state.validation_errors.values())
-                    for error in errors[:3]:
-                        st.text(f"• {error}")
-                    if len(errors) > 3:
-                        st.text(f"• ... and {len(errors) - 3} more")
+    # Quick data summary for review. Built only when asked for, or when there
+    # are errors to show, instead of filling a collapsed expander every run.
+    show_summary = st.checkbox("📊 Show data summary", key="show_data_summary")
+    if show_summary or st.session_state.validation_errors:
+        with st.expander("📊 Data Summary", expanded=True):
+            _render_data_summary(updated)
 
     # After the *with* block so we can safely return a value or abort
     if save_clicked:
@@ -638,73 +800,9 @@ def render_edit_form(validated_data: Dict) -> Optional[Dict]:
         return updated
 
     # Scroll to top and focus first input only after navigating
-    if st.session_state.get("just_navigated", False):
-        # Use multiple methods to ensure scroll happens
-        st.markdown(
-            """
-            <script>
-            (function() {
-                let scrollAttempts = 0;
-                const maxScrollAttempts = 20;
-
-                function forceScrollToTop() {
-                    // Scroll window
-                    window.scrollTo(0, 0);
-
-                    // Scroll all scrollable elements
-                    document.documentElement.scrollTop = 0;
-                    document.body.scrollTop = 0;
-
-                    // Scroll all Streamlit containers
-                    const selectors = ['.main', '.stApp', '[data-testid="stAppViewContainer"]',
-                                      '.block-container', 'section.main', 'div.main'];
-                    selectors.forEach(selector => {
-                        const elements = document.querySelectorAll(selector);
-                        elements.forEach(el => {
-                            if (el && el.scrollTop !== undefined) {
-                                el.scrollTop = 0;
-                            }
-                        });
-                    });
-
-                    scrollAttempts++;
-                }
-
-                // Immediate scroll
-                forceScrollToTop();
-
-                // Keep scrolling until we're sure we're at top or max attempts
-                const scrollInterval = setInterval(function() {
-                    forceScrollToTop();
-
-                    // Check if we're at top
-                    const isAtTop = window.pageYOffset === 0 &&
-                                   document.documentElement.scrollTop === 0 &&
-                                   document.body.scrollTop === 0;
-
-                    if (isAtTop || scrollAttempts >= maxScrollAttempts) {
-                        clearInterval(scrollInterval);
-
-                        // Focus first input after we're done scrolling
-                        setTimeout(function() {
-                            const firstInput = document.querySelector('input[type="text"], textarea, select');
-                            if (firstInput) {
-                                firstInput.focus({preventScroll: true});
-                            }
-                        }, 100);
-                    }
-                }, 50);
-
-                // Stop after 1 second regardless
-                setTimeout(function() {
-                    clearInterval(scrollInterval);
-                }, 1000);
-            })();
-            </script>
-        """,
-            unsafe_allow_html=True,
-        )
-        st.session_state.just_navigated = False
+    if just_navigated:
+        # components.html runs its script in an iframe, unlike st.markdown
+        components.html(_SCROLL_TO_TOP_HTML, height=0)
 
     # Nothing to persist this turn
     return None
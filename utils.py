@@ -1,40 +1,89 @@
 import re
+import getpass
+import functools
 import unicodedata
 from typing import Any, Dict, List, Union
 
+from schemas import FIELD_INDEX
+
+_USER = None
+
+
+def current_user() -> str:
+    """Return the OS user name, looked up once per process"""
+    global _USER
+    if _USER is None:
+        _USER = getpass.getuser()
+    return _USER
+
+
+def _is_none_value(value: Any) -> bool:
+    """True for None and the string "none" (any case)"""
+    return value is None or (isinstance(value, str) and value.lower() == "none")
+
+
 def clean_none_values(data: Union[Dict, List, Any]) -> Union[Dict, List, Any]:
     """
-    Recursively replace "none" string values and None with empty strings.
+    Replace "none" string values and None with empty strings throughout a
+    nested structure.
     This handles cases where the model has entered "none" or None instead of leaving fields empty.
 
+    Containers are walked with an explicit stack and updated in place, so no
+    new dicts or lists are allocated; the (same) top-level object is returned.
+
     Note: We do NOT remove leading zeros from numeric strings as they may be significant
     (e.g., dates like "080883" or codes like "0001").
     """
-    # Handle None values - convert to empty string
-    if data is None:
+    if _is_none_value(data):
         return ""
 
-    if isinstance(data, dict):
-        return {
-            key: clean_none_values(value)
-            for key, value in data.items()
-        }
-    elif isinstance(data, list):
-        return [clean_none_values(item) for item in data]
-    elif isinstance(data, str):
-        # Replace "none" (case-insensitive) with empty string
-        if data.lower() == "none":
-            return ""
-        # Keep the string as-is, including any leading zeros
-        return data
-    else:
-        return data
+    stack = [data]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            items = node.items()
+        elif isinstance(node, list):
+            items = enumerate(node)
+        else:
+            continue
+        for key, value in items:
+            if isinstance(value, (dict, list)):
+                stack.append(value)
+            elif _is_none_value(value):
+                # Overwriting an existing key/index doesn't disturb iteration
+                node[key] = ""
+    return data
+
+
+# Bare "-" values (-> null) and zero-padded numbers (-> quoted) in one pattern
+_JSON_FIX = re.compile(r'(:\s*)(?:-|(0\d+))(?=\s*[,\}])')
+
+
+def _fix_json_value(match: re.Match) -> str:
+    padded = match.group(2)
+    if padded is None:
+        return match.group(1) + 'null'
+    return match.group(1) + '"' + padded + '"'
 
 
 def clean_json_text(raw: str) -> str:
-    cleaned = re.sub(r'(:\s*)-(\s*[,\}])', r'\1null\2', raw)
-    cleaned = re.sub(r'(:\s*)(0\d+)(\s*[,\}])', r'\1"\2"\3', cleaned)
-    return cleaned
+    return _JSON_FIX.sub(_fix_json_value, raw)
+
+
+def _parse_int(text: str) -> int:
+    """int() of an integer or decimal string; plain integers skip the float parse"""
+    try:
+        return int(text)
+    except ValueError:
+        return int(float(text))
+
+
+# Spellings type_convert reads as True (bool fields) and as empty (None originals)
+# Common casings are listed so most values match without a lower() copy
+_TRUTHY = frozenset((
+    'true', 'True', 'TRUE', '1', 'yes', 'Yes', 'YES', 'on', 'On', 'ON'
+))
+_NULL_STRINGS = frozenset(('', 'null', 'none', 'nil', 'undefined'))
 
 
 def type_convert(val: str, original: Any) -> Any:
@@ -46,13 +95,13 @@ def type_convert(val: str, original: Any) -> Any:
     val_stripped = val.strip() if isinstance(val, str) else str(val).strip()
     
     if isinstance(original, bool):
-        return val_stripped.lower() in ('true', '1', 'yes', 'on')
+        return val_stripped in _TRUTHY or val_stripped.lower() in _TRUTHY
     
     if isinstance(original, int):
         if not val_stripped:  # Handle empty strings for integer fields
             return 0 if original == 0 else None
         try:
-            return int(float(val_stripped))  # Handle "5.0" -> 5
+            return _parse_int(val_stripped)  # Handle "5.0" -> 5
         except (ValueError, TypeError):
             return original  # Return original value if conversion fails
     
@@ -67,7 +116,7 @@ def type_convert(val: str, original: Any) -> Any:
     if original is None:
         # Handle various null representations
         low = val_stripped.lower()
-        if low in ('', 'null', 'none', 'nil', 'undefined'):
+        if low in _NULL_STRINGS:
             return ''
         return val_stripped
     
@@ -99,9 +148,9 @@ def parse_date_ddmmyy(date_str: str) -> tuple[bool, int]:
         return False, 0
 
     try:
-        day = int(date_str[0:2])
-        month = int(date_str[2:4])
-        year = int(date_str[4:6])
+        # One parse of all six digits, then split DD MM YY arithmetically
+        day, month_year = divmod(int(date_str), 10000)
+        month, year = divmod(month_year, 100)
 
         # Basic validation
         if not (1 <= day <= 31 and 1 <= month <= 12):
@@ -116,6 +165,12 @@ def parse_date_ddmmyy(date_str: str) -> tuple[bool, int]:
         return False, 0
 
 
+@functools.lru_cache(maxsize=256)
+def _get_compiled(pattern: str) -> re.Pattern:
+    """Compiled regex for schemas that don't carry a precompiled one"""
+    return re.compile(pattern)
+
+
 def validate_field(
     value: str, schema: dict, field_name: str = None, section: str = None
 ) -> tuple[bool, str]:
@@ -127,13 +182,12 @@ def validate_field(
     # Normalize value
     value = value.strip() if isinstance(value, str) else str(value).strip()
 
-    # Check required fields
-    if not value and schema.get('required', False):
-        field_desc = schema.get('description', field_name or 'This field')
-        return False, f'{field_desc} is required'
-
-    # Allow empty values for non-required fields
-    if not value and not schema.get('required', False):
+    if not value:
+        # Check required fields
+        if schema.get('required', False):
+            field_desc = schema.get('description', field_name or 'This field')
+            return False, f'{field_desc} is required'
+        # Allow empty values for non-required fields
         return True, None
 
     field_type = schema.get('type', 'string')
@@ -141,11 +195,26 @@ def validate_field(
 
     # String validation
     if field_type == 'string':
+        # Plain digit-run patterns: same result as the regex, without the regex engine
+        if 'digits' in schema:
+            min_digits, max_digits = schema['digits']
+            if not (min_digits <= len(value) <= max_digits and value.isdecimal()):
+                example = schema.get('placeholder', 'see format guidelines')
+                return False, f"{field_desc}: Invalid format. Example: {example}"
+
         # Pattern validation
-        if 'pattern' in schema:
+        elif 'pattern' in schema:
             try:
-                normalized_value = unicodedata.normalize('NFC', value)
-                if not re.fullmatch(schema['pattern'], normalized_value):
+                if value.isascii():
+                    # ASCII is already NFC and can use the smaller ASCII-only regex
+                    normalized_value = value
+                    compiled = schema.get('ascii_compiled')
+                else:
+                    normalized_value = unicodedata.normalize('NFC', value)
+                    compiled = None
+                if compiled is None:
+                    compiled = schema.get('compiled') or _get_compiled(schema['pattern'])
+                if not compiled.fullmatch(normalized_value):
                     example = schema.get('placeholder', 'see format guidelines')
                     return False, f"{field_desc}: Invalid format. Example: {example}"
             except re.error:
@@ -171,7 +240,7 @@ def validate_field(
     # Integer validation
     elif field_type == 'int':
         try:
-            num = int(float(value))  # Allow "5.0" format
+            num = _parse_int(value)  # Allow "5.0" format
             if 'min' in schema and num < schema['min']:
                 return False, f"{field_desc}: Minimum value is {schema['min']}"
             if 'max' in schema and num > schema['max']:
@@ -182,13 +251,31 @@ def validate_field(
     # Enum validation
     elif field_type == 'enum':
         options = schema.get('options', [])
-        if value not in options:
+        if value not in schema.get('options_set', options):
             options_str = ', '.join(options[:3])  # Show first 3 options
             return False, f'{field_desc}: Must be one of: {options_str}...'
 
     return True, None
 
 
+# Schemas that live for the whole process, so their id() is a stable cache key
+_SCHEMA_BY_ID = {id(schema): schema for schema in FIELD_INDEX.values()}
+
+
+@functools.lru_cache(maxsize=4096)
+def _validate_registered(value: str, schema_id: int, field_name: str, section: str) -> tuple[bool, str]:
+    return validate_field(value, _SCHEMA_BY_ID[schema_id], field_name, section)
+
+
+def validate_field_cached(
+    value: Any, schema: dict, field_name: str = None, section: str = None
+) -> tuple[bool, str]:
+    """validate_field, memoised across reruns and sessions for the FIELD_SCHEMAS entries"""
+    if type(value) is str and id(schema) in _SCHEMA_BY_ID:
+        return _validate_registered(value, id(schema), field_name, section)
+    return validate_field(value, schema, field_name, section)
+
+
 def validate_entry_dates(entry: Dict, section: str) -> tuple[bool, str]:
     """
     Validate that departure date is later than registration date in an entry.